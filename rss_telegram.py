@@ -1,16 +1,23 @@
 #!/usr/bin/env python3
 import os
+import random
 import time
-import json
 import logging
+import hashlib
+import functools
 import feedparser
 from datetime import datetime
-import requests
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
+import orjson
 from telegram import Bot
 from telegram.constants import ParseMode
+from telegram.error import RetryAfter
+from telegram.request import HTTPXRequest
 import re
 import html
+from typing import NamedTuple
 
 # Logging configuration
 logging.basicConfig(
@@ -26,173 +33,482 @@ CHECK_INTERVAL = int(os.environ.get('CHECK_INTERVAL', 3600))  # Default: 1 hour
 FEEDS_FILE = os.environ.get('FEEDS_FILE', '/app/data/feeds.txt')
 INCLUDE_DESCRIPTION = os.environ.get('INCLUDE_DESCRIPTION', 'false').lower() == 'true'  # Default: false
 DISABLE_NOTIFICATION = os.environ.get('DISABLE_NOTIFICATION', 'false').lower() == 'true'  # Default: false
+ADAPTIVE_INTERVAL = os.environ.get('ADAPTIVE_INTERVAL', 'false').lower() == 'true'  # Default: false
+MAX_HISTORY_PER_FEED = int(os.environ.get('MAX_HISTORY_PER_FEED', 5000))  # Default: 5000 sent ids per feed
 MAX_MESSAGE_LENGTH = 4096  # Maximum character limit for Telegram messages
-
-# File to store already sent articles
-HISTORY_FILE = "/app/data/sent_items.json"
+HEADER_TEMPLATE = "📢 *New content from {}*\n\n"  # Header of grouped messages, filled with the feed title
+MAX_CONCURRENT_FETCHES = 16  # Maximum number of feeds downloaded at the same time
+FETCH_TIMEOUT = 30  # Timeout in seconds for a single feed download
+PARSE_WORKERS = min(8, (os.cpu_count() or 1) * 2)  # Threads parsing downloaded feeds
+MIN_ADAPTIVE_INTERVAL = 300  # Shortest delay between checks with ADAPTIVE_INTERVAL (5 minutes)
+MAX_ADAPTIVE_INTERVAL = 86400  # Longest delay between checks with ADAPTIVE_INTERVAL (1 day)
+EWMA_WEIGHT = 0.3  # Weight of the latest gap in the average gap between posts
+POLL_JITTER = 0.1  # Random variation (±10%) of the delay between checks
+MAX_SEND_RETRIES = 3  # Maximum number of retries when Telegram asks to slow down
+TELEGRAM_POOL_SIZE = 8  # Connections to Telegram shared by the feeds sending at the same time
+TELEGRAM_POOL_TIMEOUT = 5  # Seconds to wait for a free connection to Telegram
+MAX_HISTORY_FILE_SIZE = 10 * 1024 * 1024  # Never compact the history file below 10 MB
+HISTORY_GROWTH_FACTOR = 2  # Compact the history file when it grows past this multiple of its compacted size
+
+# Append-only file to store already sent articles
+HISTORY_FILE = "/app/data/sent_items.jsonl"
+# History file used by previous versions, migrated on first start
+LEGACY_HISTORY_FILE = "/app/data/sent_items.json"
+# Size of the history file after the last compaction
+compacted_history_size = 0
+
+# Threads parsing downloaded feeds, separate from the default executor
+# that aiohttp uses for DNS lookups
+PARSE_POOL = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix='feedparse')
+
+# Pattern matching HTML tags, compiled once
+TAG_RE = re.compile(r'<[^>]+>')
 
 
 def strip_html(html_content: str) -> str:
     """Convert HTML to plain text by removing tags and unescaping entities."""
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', html_content)
+    text = TAG_RE.sub('', html_content)
     # Unescape HTML entities and normalize whitespace
     text = html.unescape(text)
     return ' '.join(text.split())
 
 
+class Entry(NamedTuple):
+    """A new feed article to notify."""
+    title: str
+    link: str
+    description: str = ''
+
+
+def format_entry(entry: Entry) -> str:
+    """Format an entry as a message line with its title and link."""
+    return f"• *{entry.title}*\n\n  {entry.link}\n\n"
+
+
+def format_entry_with_description(entry: Entry) -> str:
+    """Format an entry as a message line with its title, description and link."""
+    if not entry.description:
+        return format_entry(entry)
+
+    desc = strip_html(entry.description)
+    if len(desc) > 150:
+        desc = desc[:147] + '...'
+    return f"• *{entry.title}*\n  _{desc}_\n\n  {entry.link}\n\n"
+
+
 def load_feeds():
     """Load RSS feeds from configuration file."""
     try:
         with open(FEEDS_FILE, 'r') as f:
             feeds = [line.strip() for line in f.readlines() if line.strip() and not line.strip().startswith('#')]
-            logger.info(f"Loaded {len(feeds)} feeds from {FEEDS_FILE}")
+            logger.info("Loaded %d feeds from %s", len(feeds), FEEDS_FILE)
             return feeds
     except FileNotFoundError:
-        logger.warning(f"Feed file {FEEDS_FILE} not found. Creating empty file...")
+        logger.warning("Feed file %s not found. Creating empty file...", FEEDS_FILE)
         with open(FEEDS_FILE, 'w') as f:
             f.write("# Add your RSS feeds here, one per line\n")
         return []
     except Exception as e:
-        logger.error(f"Error loading feeds: {e}")
+        logger.error("Error loading feeds: %s", e)
         return []
 
 
-def load_sent_items():
-    """Load history of already sent articles."""
+def hash_entry_id(entry_id):
+    """Return a short fixed-size key for an entry id, which is often a long URL."""
+    return hashlib.blake2b(entry_id.encode(), digest_size=8).hexdigest()
+
+
+def load_legacy_sent_items():
+    """Load history of already sent articles from the old JSON file."""
     try:
-        with open(HISTORY_FILE, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(LEGACY_HISTORY_FILE, 'rb') as f:
+            sent_items = orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
         return {}
 
+    for feed_url, state in sent_items.items():
+        # Migrate the oldest format, where each feed only had a list of sent ids
+        if isinstance(state, list):
+            state = sent_items[feed_url] = {'ids': state}
+        # The old file only held raw ids: hash them all. Ids map to the time
+        # they were sent, unknown for migrated ones
+        state['ids'] = dict.fromkeys(map(hash_entry_id, state.get('ids', [])))
+    return sent_items
+
+
+def load_sent_items():
+    """Load history of already sent articles and per-feed metadata.
+
+    Each line of the history file is either a sent article
+    ({"feed", "id", "ts"}) or the latest metadata of a feed
+    ({"feed", "metadata"}), such as its cache headers.
+    """
+    if not os.path.exists(HISTORY_FILE):
+        return load_legacy_sent_items()
+
+    sent_items = {}
+    with open(HISTORY_FILE, 'rb') as f:
+        for line in f:
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # Line left incomplete by an interrupted write
+                continue
+
+            # Keep ids in an insertion-ordered dict: O(1) lookups, oldest first
+            state = sent_items.setdefault(record['feed'], {'ids': {}})
+            if 'metadata' in record:
+                state.update(record['metadata'])
+                continue
+
+            sent_ids = state['ids']
+            sent_ids[record['id']] = record.get('ts')
+    return sent_items
+
+
+def trim_sent_ids(sent_ids, keep):
+    """Forget the oldest sent ids of a feed, keeping the given number of most recent ones."""
+    while len(sent_ids) > keep:
+        del sent_ids[next(iter(sent_ids))]
+
+
+def feed_metadata(state):
+    """Return the metadata of a feed, without its sent ids."""
+    return {key: value for key, value in state.items() if key != 'ids'}
+
+
+def append_sent_items(feed_url, new_ids, metadata=None):
+    """Append newly sent articles and, if given, updated feed metadata to the history."""
+    with open(HISTORY_FILE, 'ab') as f:
+        for entry_id, ts in new_ids:
+            f.write(orjson.dumps({'feed': feed_url, 'id': entry_id, 'ts': ts}, option=orjson.OPT_APPEND_NEWLINE))
+        if metadata is not None:
+            f.write(orjson.dumps({'feed': feed_url, 'metadata': metadata}, option=orjson.OPT_APPEND_NEWLINE))
+
+
+def compact_sent_items(sent_items):
+    """Rewrite the history file keeping only the current state of each feed."""
+    global compacted_history_size
+    tmp_file = HISTORY_FILE + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        for feed_url, state in sent_items.items():
+            for entry_id, ts in state['ids'].items():
+                f.write(orjson.dumps({'feed': feed_url, 'id': entry_id, 'ts': ts}, option=orjson.OPT_APPEND_NEWLINE))
+            f.write(orjson.dumps({'feed': feed_url, 'metadata': feed_metadata(state)}, option=orjson.OPT_APPEND_NEWLINE))
+        # Make sure the data is on disk before replacing the old file
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, HISTORY_FILE)
+    compacted_history_size = os.path.getsize(HISTORY_FILE)
+
+
+def save_sent_items(sent_items, feed_url, new_ids, metadata=None):
+    """Save history of sent articles, compacting the file when it grows too large."""
+    if new_ids or metadata is not None:
+        append_sent_items(feed_url, new_ids, metadata)
+    # Compacting again is only worth it once enough records were appended, even
+    # when the current state alone is larger than MAX_HISTORY_FILE_SIZE
+    if os.path.getsize(HISTORY_FILE) > max(MAX_HISTORY_FILE_SIZE, HISTORY_GROWTH_FACTOR * compacted_history_size):
+        logger.info("Compacting history file %s", HISTORY_FILE)
+        compact_sent_items(sent_items)
+
+
+def update_posting_rate(state, now):
+    """Update the moving average of the gap between new posts of a feed."""
+    last_post_ts = state.get('last_post_ts')
+    if last_post_ts is not None:
+        gap = now - last_post_ts
+        ewma_gap = state.get('ewma_gap_s')
+        state['ewma_gap_s'] = gap if ewma_gap is None else EWMA_WEIGHT * gap + (1 - EWMA_WEIGHT) * ewma_gap
+    state['last_post_ts'] = now
+
+
+def jitter(delay):
+    """Randomize a delay so restarted or parallel bots do not poll in sync."""
+    return delay * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+
+
+def next_check_delay(state):
+    """Return the number of seconds to wait before checking a feed again."""
+    ewma_gap = state.get('ewma_gap_s')
+    if not ADAPTIVE_INTERVAL or ewma_gap is None:
+        return jitter(CHECK_INTERVAL)
+    return jitter(min(max(ewma_gap / 2, MIN_ADAPTIVE_INTERVAL), MAX_ADAPTIVE_INTERVAL))
+
+
+async def fetch_feed(session, semaphore, feed_url, state):
+    """Download the raw body of a feed using a conditional GET.
+
+    Returns the body, the response headers feedparser needs to decode it
+    and the new cache headers of the feed, or None when the server reports
+    the feed as not modified.
+    """
+    headers = {}
+    if state.get('etag'):
+        headers['If-None-Match'] = state['etag']
+    if state.get('modified'):
+        headers['If-Modified-Since'] = state['modified']
+
+    async with semaphore:
+        async with session.get(feed_url, headers=headers) as response:
+            if response.status == 304:
+                return None
+            response.raise_for_status()
+            validators = {
+                'etag': response.headers.get('ETag'),
+                'modified': response.headers.get('Last-Modified'),
+            }
+            response_headers = {
+                name.lower(): response.headers[name]
+                for name in ('Content-Type', 'Content-Location', 'Content-Language')
+                if name in response.headers
+            }
+            # Resolve relative links against the final URL of the feed
+            response_headers.setdefault('content-location', str(response.url))
+            return await response.read(), response_headers, validators
+
+
+class RateLimiter:
+    """Token bucket allowing at most max_calls calls in each period (in seconds)."""
+
+    def __init__(self, max_calls, period):
+        self.max_calls = max_calls
+        self.period = period
+        self.tokens = max_calls
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a call is allowed and consume a token."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self.updated_at) * self.max_calls / self.period
+                self.tokens = min(self.max_calls, self.tokens + refill)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) * self.period / self.max_calls)
+
+
+# Telegram limits: about 1 message per second and 20 messages per minute in the same chat
+MESSAGE_RATE_LIMITERS = (RateLimiter(1, 1), RateLimiter(20, 60))
 
-def save_sent_items(sent_items):
-    """Save history of sent articles."""
-    with open(HISTORY_FILE, 'w') as f:
-        json.dump(sent_items, f)
 
 async def send_telegram_message(bot, chat_id, message):
     """Send a Telegram message asynchronously."""
-    try:
-        await bot.send_message(
-            chat_id=chat_id,
-            text=message,
-            parse_mode=ParseMode.MARKDOWN,
-            disable_notification=DISABLE_NOTIFICATION
-        )
-        return True
-    except Exception as e:
-        logger.error(f"Error sending notification: {e}")
-        return False
+    for retry in range(MAX_SEND_RETRIES + 1):
+        for limiter in MESSAGE_RATE_LIMITERS:
+            await limiter.acquire()
+
+        try:
+            await bot.send_message(
+                chat_id=chat_id,
+                text=message,
+                parse_mode=ParseMode.MARKDOWN,
+                disable_notification=DISABLE_NOTIFICATION
+            )
+            return True
+        except RetryAfter as e:
+            if retry == MAX_SEND_RETRIES:
+                logger.error("Error sending notification: %s", e)
+                return False
+            logger.warning("Flood control exceeded, retrying in %s seconds", e.retry_after)
+            await asyncio.sleep(e.retry_after)
+        except Exception as e:
+            logger.error("Error sending notification: %s", e)
+            return False
 
-async def send_grouped_messages(bot, messages_by_feed):
+async def send_grouped_messages(bot, messages_by_feed,
+                                include_description=INCLUDE_DESCRIPTION, max_length=MAX_MESSAGE_LENGTH):
     """Send messages grouped by feed."""
     if not messages_by_feed:
         logger.info("No new content to notify")
         return True
 
+    formatter = format_entry_with_description if include_description else format_entry
+
     for feed_title, entries in messages_by_feed.items():
         if not entries:
             continue
 
-        header = f"📢 *New content from {feed_title}*\n\n"
-        entries_text = ""
+        header = HEADER_TEMPLATE.format(feed_title)
+        parts = []
+        running_len = len(header)
 
         for entry in entries:
-            entry_text = f"• *{entry['title']}*\n"
+            entry_text = formatter(entry)
 
-            if INCLUDE_DESCRIPTION and entry.get('description'):
-                desc = strip_html(entry['description'])
-                if len(desc) > 150:
-                    desc = desc[:147] + '...'
-                entry_text += f"  _{desc}_\n"
+            if parts and running_len + len(entry_text) > max_length:
+                await send_telegram_message(bot, TELEGRAM_CHAT_ID, header + "".join(parts))
+                parts = []
+                running_len = len(header)
 
-            entry_text += f"\n  {entry['link']}\n\n"
+            parts.append(entry_text)
+            running_len += len(entry_text)
 
-            if len(header) + len(entries_text) + len(entry_text) > MAX_MESSAGE_LENGTH:
-                await send_telegram_message(bot, TELEGRAM_CHAT_ID, header + entries_text)
-                entries_text = entry_text
-            else:
-                entries_text += entry_text
-
-        if entries_text:
-            await send_telegram_message(bot, TELEGRAM_CHAT_ID, header + entries_text)
-
-        await asyncio.sleep(1)
+        if parts:
+            await send_telegram_message(bot, TELEGRAM_CHAT_ID, header + "".join(parts))
 
     return True
 
-async def check_feeds(bot):
-    """Check RSS feeds for new articles."""
-    sent_items = load_sent_items()
-    feeds = load_feeds()
-
-    if not feeds:
-        logger.warning("No feeds to check. Add feeds to the configuration file.")
-        return sent_items
+async def check_feed(bot, session, semaphore, feed_url, sent_items):
+    """Check a single RSS feed for new articles.
 
-    messages_by_feed = {}
+    Returns the (id, timestamp) pairs of the articles sent.
+    """
+    state = sent_items.setdefault(feed_url, {'ids': {}})
+    logger.info("Checking feed: %s", feed_url)
+    # Ids of the new articles, in feed order and without duplicates
+    new_ids = {}
 
-    for feed_url in feeds:
-        if not feed_url.strip():
-            continue
+    try:
+        response = await fetch_feed(session, semaphore, feed_url, state)
+        if response is None:
+            logger.info("Feed not modified: %s", state.get('title', feed_url))
+            return []
+
+        # Parse the downloaded bytes in a worker thread, keeping the event loop free
+        body, response_headers, validators = response
+        feed = await asyncio.get_running_loop().run_in_executor(
+            PARSE_POOL, functools.partial(feedparser.parse, body, response_headers=response_headers)
+        )
 
-        logger.info(f"Checking feed: {feed_url}")
+        if not feed.entries:
+            logger.warning("No entries found in feed: %s", feed_url)
+            return []
 
-        try:
-            feed = feedparser.parse(feed_url)
+        sent_ids = state['ids']
+        new_entries = []
 
-            if not feed.entries:
-                logger.warning(f"No entries found in feed: {feed_url}")
+        for entry in feed.entries:
+            link = getattr(entry, 'link', '')
+            entry_id = hash_entry_id(getattr(entry, 'id', None) or link)
+            if entry_id in sent_ids:
+                # Move ids still listed in the feed to the end, so they are never trimmed
+                sent_ids[entry_id] = sent_ids.pop(entry_id)
+                continue
+            if entry_id in new_ids:
                 continue
 
-            feed_title = feed.feed.title if hasattr(feed.feed, 'title') else feed_url
-            sent_items.setdefault(feed_url, [])
-            messages_by_feed.setdefault(feed_title, [])
-
-            for entry in feed.entries:
-                entry_id = entry.id if hasattr(entry, 'id') else entry.link
-                if entry_id in sent_items[feed_url]:
-                    continue
-
-                title = entry.title if hasattr(entry, 'title') else "No title"
-                link = entry.link if hasattr(entry, 'link') else ""
-                description = ""
-                if INCLUDE_DESCRIPTION:
-                    description = getattr(entry, 'description', '') or getattr(entry, 'summary', '')
+            title = getattr(entry, 'title', 'No title')
+            if INCLUDE_DESCRIPTION:
+                description = getattr(entry, 'description', '') or getattr(entry, 'summary', '')
+                new_entries.append(Entry(title, link, description))
+            else:
+                new_entries.append(Entry(title, link))
+            new_ids[entry_id] = None
+    except Exception as e:
+        # Keep the old cache headers so this version of the feed is checked again
+        logger.error("Error checking feed %s: %s", feed_url, e)
+        return []
 
-                messages_by_feed[feed_title].append({'title': title, 'link': link, 'description': description})
-                sent_items[feed_url].append(entry_id)
-        except Exception as e:
-            logger.error(f"Error checking feed {feed_url}: {e}")
+    if new_entries:
+        # Feed metadata is only read when there is something to notify, and
+        # the title is kept in the history for the checks without changes
+        state['title'] = getattr(feed.feed, 'title', feed_url)
+        await send_grouped_messages(bot, {state['title']: new_entries})
+    else:
+        logger.info("No new content in feed: %s", state.get('title', feed_url))
+
+    # Only add the new ids to the history once they are sent: another feed
+    # may compact the history to disk while the messages are being sent
+    now = time.time()
+    for entry_id in new_ids:
+        sent_ids[entry_id] = now
+    trim_sent_ids(sent_ids, max(MAX_HISTORY_PER_FEED, len(feed.entries)))
+    if new_ids:
+        update_posting_rate(state, now)
+
+    # Only remember the cache headers once this version of the feed is handled
+    state.update(validators)
+    return [(entry_id, now) for entry_id in new_ids]
+
+
+async def feed_loop(bot, session, semaphore, feed_url, sent_items, offset):
+    """Periodically check a single feed, starting after the given offset."""
+    await asyncio.sleep(offset)
+    state = sent_items.setdefault(feed_url, {'ids': {}})
+    while True:
+        old_metadata = feed_metadata(state)
+        new_ids = await check_feed(bot, session, semaphore, feed_url, sent_items)
+        metadata = feed_metadata(state)
+        save_sent_items(sent_items, feed_url, new_ids, metadata if metadata != old_metadata else None)
+        delay = next_check_delay(sent_items[feed_url])
+        logger.info("Next check of %s in %.0f seconds", feed_url, delay)
+        await asyncio.sleep(delay)
 
-    await send_grouped_messages(bot, messages_by_feed)
-    return sent_items
 
 async def main_async():
     logger.info("Starting RSS feed monitoring")
-    logger.info(f"Configuration: INCLUDE_DESCRIPTION={INCLUDE_DESCRIPTION}, DISABLE_NOTIFICATION={DISABLE_NOTIFICATION}")
+    logger.info(
+        "Configuration: INCLUDE_DESCRIPTION=%s, DISABLE_NOTIFICATION=%s, ADAPTIVE_INTERVAL=%s",
+        INCLUDE_DESCRIPTION, DISABLE_NOTIFICATION, ADAPTIVE_INTERVAL
+    )
 
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
         logger.error("Missing environment variables. Make sure to set TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID")
         return
 
-    bot = Bot(token=TELEGRAM_BOT_TOKEN)
+    if MAX_HISTORY_PER_FEED < 1:
+        logger.error("Invalid MAX_HISTORY_PER_FEED=%s. It must be at least 1", MAX_HISTORY_PER_FEED)
+        return
+
+    # Feeds are checked concurrently, so their messages can be sent in parallel
+    request = HTTPXRequest(connection_pool_size=TELEGRAM_POOL_SIZE, pool_timeout=TELEGRAM_POOL_TIMEOUT)
+    bot = Bot(token=TELEGRAM_BOT_TOKEN, request=request)
     await send_telegram_message(
         bot, TELEGRAM_CHAT_ID,
         "🤖 *RSS Monitoring Bot started!*\nActive feed monitoring. Configuration loaded from file."
     )
 
-    while True:
-        sent_items = await check_feeds(bot)
-        save_sent_items(sent_items)
-        logger.info(f"Next check in {CHECK_INTERVAL} seconds")
-        await asyncio.sleep(CHECK_INTERVAL)
+    # Start from a compacted history: this also migrates the old JSON
+    # file and drops any line left incomplete by an interrupted write
+    sent_items = load_sent_items()
+    compact_sent_items(sent_items)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    timeout = aiohttp.ClientTimeout(total=FETCH_TIMEOUT)
+    # Send the same request headers as feedparser, which used to download the feeds
+    headers = {'User-Agent': feedparser.USER_AGENT, 'Accept': feedparser.http.ACCEPT_HEADER}
+    feed_tasks = {}
+
+    async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
+        # Reload the feeds file every interval: start a staggered loop for
+        # each new feed and stop the loops of removed feeds
+        while True:
+            feeds = list(dict.fromkeys(load_feeds()))
+            if not feeds:
+                logger.warning("No feeds to check. Add feeds to the configuration file.")
+
+            for feed_url in feed_tasks.keys() - set(feeds):
+                logger.info("Stopped monitoring feed: %s", feed_url)
+                feed_tasks.pop(feed_url).cancel()
+
+            for feed_url, task in list(feed_tasks.items()):
+                if task.done():
+                    logger.error("Monitoring of feed %s stopped unexpectedly: %s", feed_url, task.exception())
+                    del feed_tasks[feed_url]
+
+            new_feeds = [feed_url for feed_url in feeds if feed_url not in feed_tasks]
+            for i, feed_url in enumerate(new_feeds):
+                offset = i * CHECK_INTERVAL / len(new_feeds)
+                feed_tasks[feed_url] = asyncio.create_task(
+                    feed_loop(bot, session, semaphore, feed_url, sent_items, offset)
+                )
+
+            await asyncio.sleep(jitter(CHECK_INTERVAL))
 
 
 def main():
-    asyncio.run(main_async())
+    # Use the faster libuv-based event loop when available
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main_async())
+    else:
+        uvloop.run(main_async())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file